@@ -6,6 +6,7 @@ Generate a novel pixel-art style spritesheet + tileset and JSON metadata.
 - Optional ubelt cache dir; falls back to ~/.cache/platformer or ./assets/.
 - SCALE actually scales output and metadata.
 - Returns paths + meta; CLI writes files.
+- Re-running with unchanged inputs reuses the files already on disk.
 
 Character: "ByteBuddy" — neon-mask robot slime with hover thrusters.
 Tile size: 48x48 by default.
@@ -15,12 +16,27 @@ Usage (CLI):
 """
 
 from __future__ import annotations
+import hashlib
 import json
+import struct
+from functools import lru_cache
 from pathlib import Path
 from math import sin, pi
 
 from PIL import Image, ImageDraw
 
+try:
+    # Optional; much faster JSON encoding for the meta file.
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dep
+    orjson = None
+
+try:
+    # Optional; binary copy of the meta that loads faster than JSON.
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover - optional dep
+    msgpack = None
+
 
 url = 'https://i.imgur.com/auhIpW7.png'
 
@@ -32,6 +48,7 @@ SCALE = 1             # 1 = native pixels; 2/3+ to upscale for “chunkier” pi
 PADDING = 2           # gap between frames
 COLS = 8              # frames per row before wrapping
 BG = (0, 0, 0, 0)     # transparent
+PNG_COMPRESS_LEVEL = 1  # zlib level for PNG output; 9 = smallest files, much slower
 
 ANIMS = {
     "idle": 4,
@@ -61,64 +78,93 @@ def _new_canvas(cols: int, rows: int, tile=TILE, padding=PADDING) -> Image.Image
     h = rows * tile + (rows + 1) * padding
     return Image.new("RGBA", (w, h), BG)
 
-def _place_rect(row: int, col: int, tile=TILE, padding=PADDING) -> tuple[int, int, int, int]:
-    x = padding + col * (tile + padding)
-    y = padding + row * (tile + padding)
-    return (x, y, x + tile, y + tile)
+def _fill(img: Image.Image, box, rgba):
+    """
+    Solid fill of `box` with the same inclusive corners as `ImageDraw.rectangle`,
+    via `Image.paste`'s plain per-row fill instead of the shape rasterizer.
+    """
+    x0, y0, x1, y1 = box
+    img.paste(rgba, (x0, y0, x1 + 1, y1 + 1))
+
+def _slot_boxes(cols: int, rows: int, tile=TILE, padding=PADDING) -> list[tuple[int, int, int, int]]:
+    """Row-major (x0, y0, x1, y1) box of every slot on a `_new_canvas` grid."""
+    xs = [padding + c * (tile + padding) for c in range(cols)]
+    ys = [padding + r * (tile + padding) for r in range(rows)]
+    return [(x, y, x + tile, y + tile) for y in ys for x in xs]
+
+@lru_cache(maxsize=None)
+def _sin2pi(count: int) -> tuple[float, ...]:
+    """sin(2*pi * i/count) for every frame i of a `count`-frame loop."""
+    return tuple(sin(i / max(count, 1) * 2 * pi) for i in range(count))
+
+def _draw_bytebuddy_shell(draw: ImageDraw.ImageDraw, box):
+    """Draw the body + visor shell, which is identical in every frame."""
+    outline = C["outline"]
+    x0, y0, x1, y1 = box
+    cx = (x0 + x1) // 2
+
+    # Body
+    draw.rounded_rectangle([x0 + 6, y0 + 10, x1 - 6, y1 - 6], radius=14, fill=C["body"], outline=outline, width=2)
+
+    # Visor
+    draw.rounded_rectangle([cx - 10, y0 + 16, cx + 10, y0 + 24], radius=4, fill=C["visor"], outline=outline, width=1)
 
-def _draw_bytebuddy(draw: ImageDraw.ImageDraw, box, phase=0.0, action="idle"):
+def _draw_bytebuddy(draw: ImageDraw.ImageDraw, box, hover=0, wiggle=0, action="idle"):
+    """
+    Draw the per-frame parts of one frame on top of an already placed shell
+    (see `_draw_bytebuddy_shell`). `hover` and `wiggle` are the integer
+    per-frame offsets precomputed by the caller from the animation phase.
+    """
+    outline, accent = C["outline"], C["accent"]
     x0, y0, x1, y1 = box
     cx, cy = (x0 + x1) // 2, (y0 + y1) // 2
 
     # Hover offset for liveliness
-    hover = int(2 * sin(phase * 2 * pi))
     y0h = y0 + hover
     y1h = y1 + hover
 
-    # Body
+    # Body (drawn by the shell)
     body_rect = [x0 + 6, y0h + 10, x1 - 6, y1h - 6]
-    draw.rounded_rectangle(body_rect, radius=14, fill=C["body"], outline=C["outline"], width=2)
 
     # Fins (left/right) - wiggle on run/attack
     fin_y = (body_rect[1] + body_rect[3]) // 2
-    wiggle = int(4 * sin(phase * 2 * pi)) if action in ("run", "attack") else 0
     # Left fin
     draw.polygon([
         (body_rect[0] - 6, fin_y - 6 + wiggle),
         (body_rect[0] + 2, fin_y),
         (body_rect[0] - 6, fin_y + 6 - wiggle),
-    ], fill=C["accent"])
+    ], fill=accent)
     # Right fin
     draw.polygon([
         (body_rect[2] + 6, fin_y - 6 - wiggle),
         (body_rect[2] - 2, fin_y),
         (body_rect[2] + 6, fin_y + 6 + wiggle),
-    ], fill=C["accent"])
+    ], fill=accent)
 
-    # Visor
+    # Visor (drawn by the shell)
     visor_rect = [cx - 10, y0h + 16, cx + 10, y0h + 24]
-    draw.rounded_rectangle(visor_rect, radius=4, fill=C["visor"], outline=C["outline"], width=1)
 
     if action == "hurt":
         # X_X
-        draw.line((visor_rect[0]+2,  visor_rect[1]+1, visor_rect[0]+8,  visor_rect[1]+7),  fill=C["outline"], width=2)
-        draw.line((visor_rect[0]+8,  visor_rect[1]+1, visor_rect[0]+2,  visor_rect[1]+7),  fill=C["outline"], width=2)
-        draw.line((visor_rect[2]-8,  visor_rect[1]+1, visor_rect[2]-2,  visor_rect[1]+7),  fill=C["outline"], width=2)
-        draw.line((visor_rect[2]-2,  visor_rect[1]+1, visor_rect[2]-8,  visor_rect[1]+7),  fill=C["outline"], width=2)
+        top, bottom = visor_rect[1] + 1, visor_rect[1] + 7
+        for left, right in ((visor_rect[0] + 2, visor_rect[0] + 8), (visor_rect[2] - 8, visor_rect[2] - 2)):
+            draw.line((left, top, right, bottom), fill=outline, width=2)
+            draw.line((right, top, left, bottom), fill=outline, width=2)
     else:
         # Friendly pixels
-        draw.rectangle([visor_rect[0]+3, visor_rect[1]+3, visor_rect[0]+6, visor_rect[1]+6], fill=C["outline"])
-        draw.rectangle([visor_rect[2]-6, visor_rect[1]+3, visor_rect[2]-3, visor_rect[1]+6], fill=C["outline"])
+        draw.rectangle([visor_rect[0]+3, visor_rect[1]+3, visor_rect[0]+6, visor_rect[1]+6], fill=outline)
+        draw.rectangle([visor_rect[2]-6, visor_rect[1]+3, visor_rect[2]-3, visor_rect[1]+6], fill=outline)
 
     # Thrusters on jump/fall
     if action in ("jump", "fall"):
         flame_y = body_rect[3] + 1
+        thruster = C["thruster"]
         for dx in (-6, 6):
             draw.polygon([
                 (cx + dx - 3, flame_y),
                 (cx + dx + 3, flame_y),
                 (cx + dx, flame_y + 8 + (2 if action == "fall" else 0)) #but also not on the ground
-            ], fill=C["thruster"])
+            ], fill=thruster)
 
     # Attack swipe
     if action == "attack":
@@ -135,22 +181,29 @@ def _build_character_sheet(tile=TILE, padding=PADDING, cols=COLS, anims=ANIMS):
     sheet = _new_canvas(cols=cols, rows=rows, tile=tile, padding=padding)
     draw = ImageDraw.Draw(sheet)
 
+    # Render the shared shell once; every frame pastes it (masked by its own
+    # alpha, the shell is fully opaque) and only draws what differs on top
+    shell = Image.new("RGBA", (tile, tile), BG)
+    _draw_bytebuddy_shell(ImageDraw.Draw(shell), (0, 0, tile, tile))
+
     meta = {"tile": tile, "padding": padding, "cols": cols, "anims": {}, "frames": {}}
 
-    r = c = 0
+    slots = _slot_boxes(cols, rows, tile=tile, padding=padding)
     frame_index = 0
     for anim_name, count in anims.items():
         meta["anims"][anim_name] = {"start": frame_index, "count": count}
+        wiggles = anim_name in ("run", "attack")
+        # Shared by the hover and fin-wiggle offsets; only a handful of
+        # distinct frame counts exist, so the table is computed once per count
+        sines = _sin2pi(count)
         for i in range(count):
-            box = _place_rect(r, c, tile=tile, padding=padding)
-            phase = i / max(count, 1)
-            _draw_bytebuddy(draw, box, phase=phase, action=anim_name)
+            box = slots[frame_index]
+            hover = int(2 * sines[i])
+            wiggle = int(4 * sines[i]) if wiggles else 0
+            sheet.paste(shell, (box[0], box[1] + hover), shell)
+            _draw_bytebuddy(draw, box, hover=hover, wiggle=wiggle, action=anim_name)
             meta["frames"][str(frame_index)] = {"x": box[0], "y": box[1], "w": tile, "h": tile}
             frame_index += 1
-            c += 1
-            if c >= cols:
-                c = 0
-                r += 1
 
     return sheet, meta
 
@@ -161,22 +214,22 @@ def _build_tileset(tile=TILE, padding=PADDING):
     img = _new_canvas(tiles_across, rows, tile=tile, padding=padding)
     d = ImageDraw.Draw(img)
 
+    slots = _slot_boxes(tiles_across, rows, tile=tile, padding=padding)
+
     def tile_box(r, c):
-        x = padding + c * (tile + padding)
-        y = padding + r * (tile + padding)
-        return (x, y, x + tile, y + tile)
+        return slots[r * tiles_across + c]
 
     # Row 0: terrain
     # Grass
     b = tile_box(0, 0)
-    d.rectangle([b[0], b[1] + 10, b[2], b[3]], fill=(120, 80, 40, 255))     # dirt
-    d.rectangle([b[0], b[1] + 4, b[2], b[1] + 14], fill=(90, 200, 90, 255)) # grass cap
+    _fill(img, (b[0], b[1] + 10, b[2], b[3]), (120, 80, 40, 255))     # dirt
+    _fill(img, (b[0], b[1] + 4, b[2], b[1] + 14), (90, 200, 90, 255)) # grass cap
     # Dirt
     b = tile_box(0, 1)
-    d.rectangle([b[0], b[1], b[2], b[3]], fill=(140, 100, 60, 255))
+    _fill(img, b, (140, 100, 60, 255))
     # Stone
     b = tile_box(0, 2)
-    d.rectangle([b[0], b[1], b[2], b[3]], fill=(110, 120, 130, 255))
+    _fill(img, b, (110, 120, 130, 255))
     # Metal platform
     b = tile_box(0, 3)
     d.rectangle([b[0], b[1] + 6, b[2], b[3] - 6], fill=(60, 80, 110, 255), outline=(20, 30, 50, 255), width=2)
@@ -204,13 +257,13 @@ def _build_tileset(tile=TILE, padding=PADDING):
     # Key
     b = tile_box(1, 3)
     d.ellipse([b[0]+8, b[1]+8, b[0]+24, b[1]+24], outline=(200, 180, 80, 255), width=3)
-    d.rectangle([b[0]+24, b[1]+16, b[2]-8, b[1]+20], fill=(200, 180, 80, 255))
+    _fill(img, (b[0]+24, b[1]+16, b[2]-8, b[1]+20), (200, 180, 80, 255))
 
     # Debug colored squares
     colors = [(80,160,255,255), (120,220,120,255), (230,120,120,255), (200,200,80,255)]
     for i, col in enumerate(colors):
         b = tile_box(1, 4+i)
-        d.rectangle([b[0], b[1], b[2], b[3]], fill=col)
+        _fill(img, b, col)
 
     return img
 
@@ -221,39 +274,150 @@ def _scale_image_and_meta(img: Image.Image, meta: dict | None, scale: int):
     w, h = img.size
     img2 = img.resize((w*scale, h*scale), resample=Image.NEAREST)
     if meta:
-        meta = json.loads(json.dumps(meta))  # deep copy
-        meta["tile"] = meta["tile"] * scale
+        # Copy and scale in one pass (the input meta is left untouched)
+        meta = {
+            **meta,
+            "tile": meta["tile"] * scale,
+            "anims": {name: dict(spec) for name, spec in meta["anims"].items()},
+            "frames": {
+                k: {"x": f["x"] * scale, "y": f["y"] * scale, "w": f["w"] * scale, "h": f["h"] * scale}
+                for k, f in meta["frames"].items()
+            },
+        }
         if "padding" in meta: meta["padding"] = meta["padding"] * scale
-        for f in meta["frames"].values():
-            f["x"] *= scale; f["y"] *= scale; f["w"] *= scale; f["h"] *= scale
     return img2, meta
 
-# -----------------------------
-# Public API (safe to import)
-# -----------------------------
-def generate_assets(out_dir: str | Path | None = None, *, scale: int = SCALE):
+def _dumps_meta(meta: dict) -> bytes:
+    """Serialize meta as indented JSON bytes (same layout with or without orjson)."""
+    if orjson is not None:
+        return orjson.dumps(meta, option=orjson.OPT_INDENT_2)
+    return json.dumps(meta, indent=2).encode()
+
+def _save_meta(meta: dict, meta_path: Path):
+    """Write the meta JSON, plus a `.msgpack` copy next to it if msgpack is installed."""
+    meta_path.write_bytes(_dumps_meta(meta))
+    if msgpack is not None:
+        meta_path.with_suffix(".msgpack").write_bytes(msgpack.packb(meta, use_bin_type=True))
+
+@lru_cache(maxsize=16)
+def _parse_meta(path: str, mtime_ns: int, size: int) -> dict:
     """
-    Generate spritesheet, tileset, and meta JSON into `out_dir`.
-    Returns dict with paths, sizes, and meta.
+    Parse one version of a meta file; the stat fields only key the cache.
+    The cached dict is shared, so it must never leave this module uncopied.
+    """
+    data = Path(path).read_bytes()
+    if path.endswith(".msgpack"):
+        return msgpack.unpackb(data, raw=False)
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _copy_meta(data):
+    """Fresh copy of parsed meta: new dicts/lists, shared scalar leaves."""
+    if isinstance(data, dict):
+        return {k: _copy_meta(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_copy_meta(v) for v in data]
+    return data
+
+def _load_meta(meta_path) -> dict:
     """
+    Read meta, preferring its `.msgpack` copy unless that is missing or stale.
+    Parses are cached per (path, mtime, size); callers get their own copy.
+    """
+    meta_path = Path(meta_path)
+    if msgpack is not None:
+        packed_path = meta_path.with_suffix(".msgpack")
+        try:
+            packed = packed_path.stat()
+            if packed.st_mtime >= meta_path.stat().st_mtime:
+                return _copy_meta(_parse_meta(str(packed_path), packed.st_mtime_ns, packed.st_size))
+        except (OSError, ValueError):
+            pass
+    st = meta_path.stat()
+    return _copy_meta(_parse_meta(str(meta_path), st.st_mtime_ns, st.st_size))
+
+# Header of the `.raw` sidecars: width, height (pixels follow as RGBA bytes)
+_RAW_HEADER = struct.Struct("<II")
+
+def _save_raw(img: Image.Image, png_path: Path):
+    """Write `img` as raw RGBA next to its PNG so loaders can skip decoding."""
+    png_path.with_suffix(".raw").write_bytes(_RAW_HEADER.pack(*img.size) + img.tobytes())
+
+def _cache_key(scale: int, compress_level: int) -> str:
+    """
+    Content hash of every input that affects the generated files: the config
+    and options, plus this module's source so edits to the drawing code
+    (shapes, tileset colours) invalidate the cache too.
+    """
+    inputs = repr((TILE, PADDING, COLS, BG, ANIMS, C, scale, compress_level))
+    h = hashlib.blake2b(inputs.encode(), digest_size=8)
+    h.update(Path(__file__).read_bytes())
+    return h.hexdigest()
 
+def _default_asset_dir() -> Path:
+    """Per-user cache dir used when no explicit asset dir is given (created if needed)."""
     try:
         # Optional; used only to pick a cache path if no --outdir is given.
         import ubelt as ub  # type: ignore
     except Exception:  # pragma: no cover - optional dep
         ub = None
 
-    if out_dir is None:
-        if ub is not None:
-            out_dir = ub.Path.appdir("platformer").ensuredir()
-        else:
-            # Fallback: ~/.cache/platformer or ./assets
-            home_cache = Path.home() / ".cache" / "platformer"
-            out_dir = home_cache if home_cache.parent.exists() else Path("./assets")
-            out_dir.mkdir(parents=True, exist_ok=True)
+    if ub is not None:
+        return Path(ub.Path.appdir("platformer").ensuredir())
+    # Fallback: ~/.cache/platformer or ./assets
+    home_cache = Path.home() / ".cache" / "platformer"
+    out_dir = home_cache if home_cache.parent.exists() else Path("./assets")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return out_dir
+
+# -----------------------------
+# Public API (safe to import)
+# -----------------------------
+def generate_assets(
+    out_dir: str | Path | None = None,
+    *,
+    scale: int = SCALE,
+    compress_level: int = PNG_COMPRESS_LEVEL,
+    force: bool = False,
+):
+    """
+    Generate spritesheet, tileset, and meta JSON into `out_dir`.
+    Returns dict with paths, sizes, and meta.
+
+    Outputs are reused when a previous run with identical inputs already
+    wrote them (tracked by `bytebuddy_cache.json`); pass `force=True` to
+    always rebuild. PNGs are encoded with a fast `compress_level` by
+    default; use 9 for distributable (smaller) files.
+    """
 
+    if out_dir is None:
+        out_dir = _default_asset_dir()
     out_dir = Path(out_dir)
 
+    sheet_path = out_dir / "bytebuddy_spritesheet.png"
+    meta_path  = out_dir / "bytebuddy_meta.json"
+    tiles_path = out_dir / "bytebuddy_tileset.png"
+    cache_path = out_dir / "bytebuddy_cache.json"
+
+    # Skip rendering entirely if the files on disk came from the same inputs
+    key = _cache_key(scale, compress_level)
+    outputs = (sheet_path, sheet_path.with_suffix(".raw"), tiles_path, tiles_path.with_suffix(".raw"),
+               meta_path, cache_path)
+    if not force and all(p.exists() for p in outputs):
+        try:
+            cached = json.loads(cache_path.read_text())
+            meta = _load_meta(meta_path)
+        except (OSError, ValueError):
+            cached = {}
+        if cached.get("key") == key:
+            return {
+                "sheet_path": str(sheet_path),
+                "meta_path": str(meta_path),
+                "tiles_path": str(tiles_path),
+                "sheet_size": tuple(cached["sheet_size"]),
+                "tiles_size": tuple(cached["tiles_size"]),
+                "meta": meta,
+            }
+
     # Build images & meta in-memory
     sheet_img, meta = _build_character_sheet()
     tiles_img = _build_tileset()
@@ -263,14 +427,20 @@ def generate_assets(out_dir: str | Path | None = None, *, scale: int = SCALE):
     tiles_img, _ = _scale_image_and_meta(tiles_img, None, scale)
 
     # Write files
-    sheet_path = out_dir / "bytebuddy_spritesheet.png"
-    meta_path  = out_dir / "bytebuddy_meta.json"
-    tiles_path = out_dir / "bytebuddy_tileset.png"
-
-    sheet_img.save(sheet_path, "PNG")
-    tiles_img.save(tiles_path, "PNG")
-    with open(meta_path, "w") as f:
-        json.dump(meta, f, indent=2)
+    # Skip zlib's slow high levels and the optimize pass: the sheets are tiny
+    # and mostly transparent, so the size win is small and encode time dominates
+    sheet_img.save(sheet_path, "PNG", compress_level=compress_level, optimize=False)
+    tiles_img.save(tiles_path, "PNG", compress_level=compress_level, optimize=False)
+    _save_meta(meta, meta_path)
+    # After the PNGs, so each .raw is never older than the PNG it mirrors
+    _save_raw(sheet_img, sheet_path)
+    _save_raw(tiles_img, tiles_path)
+    # Written last so an interrupted run never looks like a cache hit
+    cache_path.write_text(json.dumps({
+        "key": key,
+        "sheet_size": sheet_img.size,
+        "tiles_size": tiles_img.size,
+    }))
 
     return {
         "sheet_path": str(sheet_path),
@@ -282,39 +452,52 @@ def generate_assets(out_dir: str | Path | None = None, *, scale: int = SCALE):
     }
 
 # -----------------------------
-# CLI (only runs when executed)
+# Loaders (pygame is imported lazily so generating assets doesn't need it)
 # -----------------------------
-
-# platformer/assets.py
-import json, os, pygame  # NOQA
-from pathlib import Path  # NOQA
-import ubelt as ub
-
-
-ASSET_DIR = Path(__file__).parent / "assets"
-ASSET_DIR = ub.Path.appdir("platformer").ensuredir()
-
+def _load_surface(image_path):
+    """
+    Load an image as a per-pixel-alpha Surface in the display's format.
+    Prefers the `.raw` RGBA sidecar written by `generate_assets` (no PNG
+    decode) unless it is missing, malformed, or older than the image.
+    """
+    import pygame
+    image_path = Path(image_path)
+    raw_path = image_path.with_suffix(".raw")
+    try:
+        if raw_path.stat().st_mtime >= image_path.stat().st_mtime:
+            data = raw_path.read_bytes()
+            w, h = _RAW_HEADER.unpack_from(data)
+            pixels = memoryview(data)[_RAW_HEADER.size:]
+            return pygame.image.frombuffer(pixels, (w, h), "RGBA").convert_alpha()
+    except (OSError, ValueError, struct.error):
+        pass
+    return pygame.image.load(image_path).convert_alpha()
 
 class SpriteSheet:
     """Loads a spritesheet + meta (with tile, padding, cols)."""
     def __init__(self, image_path, meta_path):
-        self.image = pygame.image.load(image_path).convert_alpha()
-        with open(meta_path, "r") as f:
-            self.meta = json.load(f)
+        self.image = _load_surface(image_path)
+        self.meta = _load_meta(meta_path)
         self.tile   = self.meta["tile"]
         self.cols   = self.meta.get("cols", 8)
         self.pad    = self.meta.get("padding", 2)
         self.frames = self.meta["frames"]      # index->{x,y,w,h}
         self.anims  = self.meta["anims"]       # name->{start,count}
+        self._frame_cache = {}                 # index->subsurface
 
     def frame_rect(self, idx):
+        import pygame
         f = self.frames[str(idx)]
         return pygame.Rect(f["x"], f["y"], f["w"], f["h"])
 
     def frame_surf(self, idx):
-        r = self.frame_rect(idx)
-        s = pygame.Surface((r.w, r.h), pygame.SRCALPHA)
-        s.blit(self.image, (0,0), r)
+        """
+        Zero-copy view of frame `idx`: shares pixels with the sheet, so call
+        .copy() on it before drawing onto it.
+        """
+        s = self._frame_cache.get(idx)
+        if s is None:
+            s = self._frame_cache[idx] = self.image.subsurface(self.frame_rect(idx))
         return s
 
     def anim_surfs(self, name):
@@ -323,38 +506,48 @@ class SpriteSheet:
         return [self.frame_surf(start + i) for i in range(count)]
 
 def load_tileset_grid(image_path, tile, pad):
-    """Slices a uniformly padded tileset into a list of Surfaces (row-major)."""
-    img = pygame.image.load(image_path).convert_alpha()
+    """
+    Slices a uniformly padded tileset into a list of Surfaces (row-major).
+    The tiles are zero-copy subsurfaces of the loaded image.
+    """
+    img = _load_surface(image_path)
     w, h = img.get_size()
-    frames = []
-    y = pad
-    while y + tile <= h:
-        x = pad
-        while x + tile <= w:
-            s = pygame.Surface((tile, tile), pygame.SRCALPHA)
-            s.blit(img, (0,0), (x, y, tile, tile))
-            frames.append(s)
-            x += tile + pad
-        y += tile + pad
-    return frames
-
-def get_default_paths():
+    step = tile + pad
+    return [
+        img.subsurface((x, y, tile, tile))
+        for y in range(pad, h - tile + 1, step)
+        for x in range(pad, w - tile + 1, step)
+    ]
+
+@lru_cache(maxsize=None)
+def _default_paths():
+    asset_dir = _default_asset_dir()
     paths = {
-        "sheet":  ASSET_DIR / "bytebuddy_spritesheet.png",
-        "meta":   ASSET_DIR / "bytebuddy_meta.json",
-        "tiles":  ASSET_DIR / "bytebuddy_tileset.png",
+        "sheet":  asset_dir / "bytebuddy_spritesheet.png",
+        "meta":   asset_dir / "bytebuddy_meta.json",
+        "tiles":  asset_dir / "bytebuddy_tileset.png",
     }
     print(f'paths={paths}')
     return  paths
 
+def get_default_paths():
+    """Default asset paths (resolved once per process; callers get a fresh dict)."""
+    return dict(_default_paths())
 
+# -----------------------------
+# CLI (only runs when executed)
+# -----------------------------
 def main():
     import argparse
     ap = argparse.ArgumentParser(description="Generate ByteBuddy spritesheet/tileset.")
     ap.add_argument("--outdir", type=str, default=None, help="Where to write assets")
     ap.add_argument("--scale", type=int, default=SCALE, help="Integer scale factor (1=original)")
+    ap.add_argument("--compress-level", type=int, default=PNG_COMPRESS_LEVEL,
+                    help="PNG zlib level 0-9 (9 for smallest release files)")
+    ap.add_argument("--force", action="store_true", help="Rebuild even if cached outputs match")
     args = ap.parse_args()
-    result = generate_assets(args.outdir, scale=max(1, int(args.scale)))
+    result = generate_assets(args.outdir, scale=max(1, int(args.scale)),
+                             compress_level=args.compress_level, force=args.force)
     print(json.dumps(result, indent=2))
 
 
@@ -1,4 +1,5 @@
 # level.py
+import re
 import pygame
 from platformer.settings import TILE_SIZE
 
@@ -24,26 +25,70 @@ TILEMAP = [
 
 
 class Platform(pygame.sprite.Sprite):
-    def __init__(self, x, y, w, h, color):
+    def __init__(self, x, y, w, h, color, image=None):
+        """Pass `image` to share one pre-filled Surface between platforms."""
         super().__init__()
-        self.image = pygame.Surface((w, h))
-        self.image.fill(color)
+        if image is None:
+            image = pygame.Surface((w, h))
+            image.fill(color)
+        self.image = image
         self.rect = self.image.get_rect(topleft=(x, y))
 
 
+class SolidGrid:
+    """
+    Uniform-grid spatial hash over a static list of solid rects, so collision
+    checks only look at the few rects sharing a cell with the query rect.
+    """
+    def __init__(self, rects, cell=TILE_SIZE):
+        self.rects = list(rects)
+        self.cell = cell
+        self.cells = {}  # (col, row) -> indices into self.rects
+        for i, r in enumerate(self.rects):
+            for key in self._keys(r):
+                self.cells.setdefault(key, []).append(i)
+
+    def _keys(self, rect):
+        # right/bottom are exclusive, so a rect ending on a cell edge stays out of the next cell
+        cell = self.cell
+        c0, c1 = rect.left // cell, (rect.right - 1) // cell
+        r0, r1 = rect.top // cell, (rect.bottom - 1) // cell
+        return [(c, r) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)]
+
+    def query(self, rect):
+        """Rects that may overlap `rect`, in their original list order."""
+        cells = self.cells
+        found = set()
+        for key in self._keys(rect):
+            found.update(cells.get(key, ()))
+        rects = self.rects
+        return [rects[i] for i in sorted(found)]
+
+
 class Level:
     def __init__(self, platform_color):
         self.platforms = pygame.sprite.Group()
         self.solids = []  # list of rects for collision speed
+        self._platform_at = {}  # (col, row) -> Platform, for view culling
+
+        # Every tile looks the same, so all platforms share one Surface
+        tile_image = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        tile_image.fill(platform_color)
 
         for row_idx, row in enumerate(TILEMAP):
-            for col_idx, ch in enumerate(row):
-                if ch == "X":
-                    x = col_idx * TILE_SIZE
-                    y = row_idx * TILE_SIZE
-                    plat = Platform(x, y, TILE_SIZE, TILE_SIZE, platform_color)
-                    self.platforms.add(plat)
-                    self.solids.append(plat.rect)
+            y = row_idx * TILE_SIZE
+            # Let the regex engine find the solid cells instead of visiting each char
+            for match in re.finditer("X", row):
+                x = match.start() * TILE_SIZE
+                plat = Platform(x, y, TILE_SIZE, TILE_SIZE, platform_color, image=tile_image)
+                self.platforms.add(plat)
+                self.solids.append(plat.rect)
+                self._platform_at[(match.start(), row_idx)] = plat
+
+        self.solid_grid = SolidGrid(self.solids)
+
+        # Rows may differ in length; culling must reach the longest one
+        self._cols = max(map(len, TILEMAP))
 
         # Level bounds (for camera clamping)
         width = len(TILEMAP[0]) * TILE_SIZE
@@ -51,6 +96,22 @@ class Level:
         self.size = (width, height)
 
     def draw(self, surface, offset):
-        # Draw platforms with camera offset
-        for p in self.platforms:
-            surface.blit(p.image, p.rect.move(-offset.x, -offset.y))
+        """
+        Draw platforms with camera offset, visiting only the tiles in view.
+        Only platforms built from TILEMAP are drawn: one added to
+        self.platforms later must also go into self._platform_at.
+        """
+        view_w, view_h = surface.get_size()
+        ox, oy = int(offset[0]), int(offset[1])
+        # Clamp to the map so zooming out past the edges never visits empty cells
+        c0 = max(ox // TILE_SIZE, 0)
+        c1 = min((ox + view_w) // TILE_SIZE + 1, self._cols)
+        r0 = max(oy // TILE_SIZE, 0)
+        r1 = min((oy + view_h) // TILE_SIZE + 1, len(TILEMAP))
+        platform_at = self._platform_at
+        visible = (platform_at.get((col, row)) for row in range(r0, r1) for col in range(c0, c1))
+        # One blits() call submits the whole batch instead of a blit per tile
+        surface.blits(
+            [(p.image, (p.rect.x - ox, p.rect.y - oy)) for p in visible if p is not None],
+            doreturn=False,
+        )
@@ -1,6 +1,8 @@
 # main.py
 import sys
+from functools import lru_cache
 import pygame
+import pygame.freetype
 from platformer.settings import WIDTH, HEIGHT, FPS, TITLE, SKY, GROUND
 from platformer.settings import WHITE
 from platformer.level import Level
@@ -9,6 +11,13 @@ from platformer.sprites import Player
 
 TILE_SIZE = 48
 
+def _clamp(v, lo, hi):
+    """max(lo, min(v, hi)) without the builtin calls; lo wins if hi < lo."""
+    if v > hi:
+        v = hi
+    return lo if v < lo else v
+
+
 def compute_camera_offset(player_rect, level_size, screen_size, margin=200):
     """
     A simple camera that follows the player but clamps to level bounds.
@@ -16,58 +25,87 @@ def compute_camera_offset(player_rect, level_size, screen_size, margin=200):
     """
     lx, ly = level_size
     sw, sh = screen_size
+    cx, cy = player_rect.center
 
     # Desired center on player
-    target_x = player_rect.centerx - sw // 2
-    target_y = player_rect.centery - sh // 2
+    target_x = cx - sw // 2
+    target_y = cy - sh // 2
 
     # Optional deadzone (smooth panning)
     dx = 0
-    if player_rect.centerx < margin:
-        dx = margin - player_rect.centerx
-    elif player_rect.centerx > (lx - margin):
-        dx = (lx - margin) - player_rect.centerx
+    if cx < margin:
+        dx = margin - cx
+    elif cx > (lx - margin):
+        dx = (lx - margin) - cx
 
     dy = 0
-    if player_rect.centery < margin:
-        dy = margin - player_rect.centery
-    elif player_rect.centery > (ly - margin):
-        dy = (ly - margin) - player_rect.centery
+    if cy < margin:
+        dy = margin - cy
+    elif cy > (ly - margin):
+        dy = (ly - margin) - cy
 
     target_x -= dx
     target_y -= dy
 
     # Clamp to level
-    target_x = max(0, min(target_x, lx - sw))
-    target_y = max(0, min(target_y, ly - sh))
+    target_x = _clamp(target_x, 0, lx - sw)
+    target_y = _clamp(target_y, 0, ly - sh)
+
+    return (target_x, target_y)
 
-    return pygame.Vector2(target_x, target_y)
+
+@lru_cache(maxsize=1)
+def _grid_overlay(size, grid, rgb):
+    """
+    Grid lines every `grid` px on a colorkeyed surface one cell larger than
+    `size`, so any scroll position is just a shifted blit of the same overlay.
+    Only the current view size is kept; a zoom step rebuilds it once.
+    """
+    w, h = size[0] + grid, size[1] + grid
+    key = (0, 0, 0) if rgb != (0, 0, 0) else (255, 255, 255)
+    overlay = pygame.Surface((w, h))
+    overlay.fill(key)
+    for x in range(0, w, grid):
+        pygame.draw.line(overlay, rgb, (x, 0), (x, h), 1)
+    for y in range(0, h, grid):
+        pygame.draw.line(overlay, rgb, (0, y), (w, y), 1)
+    # RLE makes the blit skip the (mostly) transparent runs between lines
+    overlay.set_colorkey(key, pygame.RLEACCEL)
+    return overlay
 
 
 def draw_grid(surface, offset, grid=48, color=(255, 255, 255, 30)):
     # lightly draw a grid to help students visualize tiles
-    w, h = surface.get_size()
-    ox, oy = int(offset.x), int(offset.y)
-    grid_color = surface.map_rgb(color[:3])
-    for x in range(-ox % grid, w, grid):
-        pygame.draw.line(surface, grid_color, (x, 0), (x, h), 1)
-    for y in range(-oy % grid, h, grid):
-        pygame.draw.line(surface, grid_color, (0, y), (w, y), 1)
+    ox, oy = int(offset[0]), int(offset[1])
+    overlay = _grid_overlay(surface.get_size(), grid, tuple(color[:3]))
+    surface.blit(overlay, (-(ox % grid), -(oy % grid)))
+
+
+@lru_cache(maxsize=1)
+def _view_surface(size, flags=0, like=None):
+    """
+    Reusable view-sized working surface; only changes when the zoom does.
+    Only the latest (size, flags) is kept, so old sizes are freed after a zoom.
+    Callers must refill it each frame since the same Surface comes back.
+    """
+    if like is not None:
+        return pygame.Surface(size, flags, like)
+    return pygame.Surface(size, flags)
 
 
 def render_view(
     world_surface: pygame.Surface,
-    camera_offset: pygame.Vector2,
+    camera_offset: tuple[float, float],
     view_size: tuple[int, int],
     bg_color=(135, 206, 235, 255),
 ) -> pygame.Surface:
     """
     Returns a view-sized surface showing the world at camera_offset.
     Handles edges (off-level regions) by filling with bg_color.
-    No subsurface OOB errors.
+    No subsurface OOB errors. The surface is reused by the next call.
     """
     vw, vh = view_size
-    view = pygame.Surface((vw, vh), pygame.SRCALPHA)
+    view = _view_surface((vw, vh), pygame.SRCALPHA)
     # Fill with sky (or any background)
     view.fill(bg_color)
 
@@ -75,7 +113,7 @@ def render_view(
     dest = pygame.Rect(0, 0, vw, vh)
 
     # Portion of the world we can actually sample
-    src = pygame.Rect(int(camera_offset.x), int(camera_offset.y), vw, vh)
+    src = pygame.Rect(int(camera_offset[0]), int(camera_offset[1]), vw, vh)
     world_rect = world_surface.get_rect()
     src_clamped = src.clip(world_rect)
 
@@ -95,32 +133,26 @@ def compute_camera_offset_zoomaware(
     view_size: tuple[int, int],
     zoom: float = 1.0,
     edge_pad: int = 512,
-) -> pygame.Vector2:
+) -> tuple[float, float]:
     """
     Clamp at zoom=1, allow off-level 'peek' when zoomed out (<1),
     and tighter clamp when zoomed in (>1).
     """
     lx, ly = level_size
     vw, vh = view_size
+    cx, cy = target_rect.center
 
-    target_x = target_rect.centerx - vw // 2
-    target_y = target_rect.centery - vh // 2
+    target_x = cx - vw // 2
+    target_y = cy - vh // 2
 
-    # When zoom=1, strict clamp to level
-    if abs(zoom - 1.0) < 1e-3:
-        target_x = max(0, min(target_x, lx - vw))
-        target_y = max(0, min(target_y, ly - vh))
-    elif zoom < 1.0:
-        # zoomed out: allow extra lookaround proportional to how far zoomed out
-        pad = int(edge_pad * (1.0 - zoom))
-        target_x = max(-pad, min(target_x, lx - vw + pad))
-        target_y = max(-pad, min(target_y, ly - vh + pad))
-    else:
-        # zoomed in: smaller view; keep clamped tighter so we don’t see voids
-        target_x = max(0, min(target_x, lx - vw))
-        target_y = max(0, min(target_y, ly - vh))
+    # Zoomed out: allow extra lookaround proportional to how far zoomed out.
+    # At zoom=1 (strict clamp to level) and zoomed in (smaller view; keep
+    # clamped tighter so we don’t see voids) there is no padding.
+    pad = int(edge_pad * (1.0 - zoom)) if zoom < 1.0 - 1e-3 else 0
+    target_x = _clamp(target_x, -pad, lx - vw + pad)
+    target_y = _clamp(target_y, -pad, ly - vh + pad)
 
-    return pygame.Vector2(target_x, target_y)
+    return (target_x, target_y)
 
 
 def main():
@@ -137,11 +169,10 @@ def main():
     level = Level(platform_color=(80, 180, 120))
     player = Player(start_pos=(100, 100))
 
-    # Build a canvas larger than the level so we can draw offscreen content
-    world_w, world_h = level.size
-    universe_w = world_w + EDGE_PAD * 2
-    universe_h = world_h + EDGE_PAD * 2
-    universe_surface = pygame.Surface((universe_w, universe_h), pygame.SRCALPHA)
+    # HUD: build the font once; render_to draws straight onto the screen, so
+    # no per-frame text Surface is allocated. Size 16 matches the old
+    # pygame.font default font at 24 (which scales the default font down).
+    hud_font = pygame.freetype.SysFont(None, 16)
 
     running = True
     while running:
@@ -161,14 +192,14 @@ def main():
                     camera_zoom = min(MAX_ZOOM, camera_zoom / ZOOM_STEP)
 
         keys = pygame.key.get_pressed()
-        player.update(keys, level.solids, dt)
+        player.update(keys, level.solid_grid, dt)
 
         # Determine viewport size based on zoom
         view_w = int(screen.get_width() / camera_zoom)
         view_h = int(screen.get_height() / camera_zoom)
 
         # Compute offset with conditional clamp
-        camera_offset_world = compute_camera_offset_zoomaware(
+        cam_x, cam_y = camera_offset_world = compute_camera_offset_zoomaware(
             player.rect,
             level.size,
             (view_w, view_h),
@@ -176,56 +207,38 @@ def main():
             edge_pad=EDGE_PAD,
         )
 
-        # Draw world to buffer
-        # Convert WORLD camera offset to UNIVERSE coords by adding EDGE_PAD
-        camera_offset_universe = pygame.Vector2(
-            camera_offset_world.x + EDGE_PAD,
-            camera_offset_world.y + EDGE_PAD
-        )
-
-        # Draw world (level + player) into the UNIVERSE canvas
-        universe_surface.fill(SKY)  # fill off-level space with sky
-        # Level.draw subtracts the given offset: pass negative to place level at +EDGE_PAD
-        level.draw(universe_surface, pygame.Vector2(-EDGE_PAD, -EDGE_PAD))
-        # Grid in universe coords so it scrolls/zooms with the world
-        draw_grid(
-            universe_surface,
-            pygame.Vector2(-EDGE_PAD, -EDGE_PAD),
-            grid=TILE_SIZE,
-            color=(255, 255, 255, 40),
-        )
-        # Player in universe coords
-        if player.visual:
-            universe_surface.blit(
-                player.visual.image,
-                (EDGE_PAD + player.rect.x, EDGE_PAD + player.rect.y),
-            )
-        else:
-            pygame.draw.rect(
-                universe_surface,
-                (255, 100, 100),
-                pygame.Rect(EDGE_PAD + player.rect.x, EDGE_PAD + player.rect.y, player.rect.w, player.rect.h),
-            )
-
-        # Safe render + scale to screen
-        view = render_view(universe_surface, camera_offset_universe, (view_w, view_h), bg_color=SKY)
-        scaled_view = pygame.transform.scale(view, screen.get_size())
-        screen.blit(scaled_view, (0, 0))
+        # Draw world (level + grid + player) straight into a view-sized canvas;
+        # anything outside the level is just the sky fill showing through
+        view = _view_surface((view_w, view_h), 0, screen)
+        view.fill(SKY)
+        level.draw(view, camera_offset_world)
+        # Grid in world coords so it scrolls/zooms with the world
+        draw_grid(view, camera_offset_world, grid=TILE_SIZE, color=(255, 255, 255, 40))
+        # Player, unless it's entirely outside the view
+        view_rect = pygame.Rect(int(cam_x), int(cam_y), view_w, view_h)
+        if view_rect.colliderect(player.cullable_rect):
+            player_x = player.rect.x - view_rect.x
+            player_y = player.rect.y - view_rect.y
+            if player.visual:
+                view.blit(player.visual.image, (player_x, player_y))
+            else:
+                pygame.draw.rect(
+                    view,
+                    (255, 100, 100),
+                    pygame.Rect(player_x, player_y, player.rect.w, player.rect.h),
+                )
+
+        # Scale straight into the display surface
+        pygame.transform.scale(view, screen.get_size(), screen)
 
         # HUD
-        font = pygame.font.SysFont(None, 24)
-        screen.blit(
-            font.render("Arrows/A-D move, Space/W/Up jump", True, WHITE), (12, 10)
-            
-        )
+        hud_font.render_to(screen, (12, 10), "Arrows/A-D move, Space/W/Up jump", WHITE)
         if dev:
-            screen.blit(
-                font.render(
-                    f"Zoom: {camera_zoom:.2f}  EdgePad: {EDGE_PAD}, Zoom: {camera_zoom:.2f}",
-                    True,
-                    WHITE,
-                ),
+            hud_font.render_to(
+                screen,
                 (12, 34),
+                f"Zoom: {camera_zoom:.2f}  EdgePad: {EDGE_PAD}, Zoom: {camera_zoom:.2f}",
+                WHITE,
             )
 
         pygame.display.flip()
@@ -1,4 +1,5 @@
 # sprites.py (Player class)
+from functools import lru_cache
 import pygame
 from .settings import (
     PLAYER_COLOR, MOVE_SPEED, GRAVITY, JUMP_VEL, TILE_SIZE,
@@ -6,11 +7,24 @@ from .settings import (
 )
 from .anim import AnimSprite
 from .assets import SpriteSheet, get_default_paths
+from .level import SolidGrid
 
 # flip to False to use colored rectangles
 # USE_SPRITES = False
 USE_SPRITES = True
 
+# looked up every frame in handle_input
+_K_LEFT, _K_A, _K_RIGHT, _K_D = pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d
+
+ANIM_NAMES = ("idle", "run", "jump", "fall", "attack", "hurt")
+
+
+@lru_cache(maxsize=None)
+def _load_anims(sheet_path, meta_path):
+    """Load the sheet and slice every animation once per process."""
+    sheet = SpriteSheet(sheet_path, meta_path)
+    return {name: sheet.anim_surfs(name) for name in ANIM_NAMES}
+
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, start_pos):
@@ -18,8 +32,9 @@ class Player(pygame.sprite.Sprite):
         # physics body (rect only; visual can be different size if you prefer)
         self.rect = pygame.Rect(start_pos[0], start_pos[1],
                                 int(TILE_SIZE * 0.8), int(TILE_SIZE * 0.9))
-        self.pos = pygame.Vector2(self.rect.topleft)
-        self.vel = pygame.Vector2(0, 0)
+        # plain floats: per-frame physics never crosses into Vector2
+        self.pos_x, self.pos_y = float(self.rect.x), float(self.rect.y)
+        self.vel_x = self.vel_y = 0.0
         self.on_ground = False
 
         # jump helpers
@@ -27,72 +42,121 @@ class Player(pygame.sprite.Sprite):
         self.jump_buffer_timer = 0.0
         self.jumps = 0
 
+        # spatial index for a plain list of solids, rebuilt only if a different list is passed
+        self._solids_src = None
+        self._solids_grid = None
+
         # visuals
         self.visual = None
         if USE_SPRITES:
             paths = get_default_paths()
-            sheet = SpriteSheet(paths["sheet"], paths["meta"])
+            # Surfaces are shared between players; only the lists are copied
             anims = {
-                "idle":   sheet.anim_surfs("idle"),
-                "run":    sheet.anim_surfs("run"),
-                "jump":   sheet.anim_surfs("jump"),
-                "fall":   sheet.anim_surfs("fall"),
-                "attack": sheet.anim_surfs("attack"),
-                "hurt":   sheet.anim_surfs("hurt"),
+                name: list(frames)
+                for name, frames in _load_anims(paths["sheet"], paths["meta"]).items()
             }
             self.visual = AnimSprite(anims, pos=self.rect.topleft, fps=10)
         else:
             self.image = pygame.Surface((self.rect.w, self.rect.h), pygame.SRCALPHA)
             self.image.fill(PLAYER_COLOR)
 
+    @property
+    def pos(self):
+        """A Vector2 copy; assign to .pos (or pos_x/pos_y) to change it."""
+        return pygame.Vector2(self.pos_x, self.pos_y)
+
+    @pos.setter
+    def pos(self, value):
+        self.pos_x, self.pos_y = value
+
+    @property
+    def vel(self):
+        """A Vector2 copy; assign to .vel (or vel_x/vel_y) to change it."""
+        return pygame.Vector2(self.vel_x, self.vel_y)
+
+    @vel.setter
+    def vel(self, value):
+        self.vel_x, self.vel_y = value
+
+    @property
+    def cullable_rect(self):
+        """World-space rect covering everything drawn for the player (for view culling)."""
+        # update() keeps visual.rect on the physics rect, so this is always current
+        return self.visual.rect if self.visual else self.rect
+
     # ---------- input & movement ----------
     def handle_input(self, keys):
-        self.vel.x = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.vel.x = -MOVE_SPEED
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.vel.x = MOVE_SPEED
+        self.vel_x = 0
+        if keys[_K_LEFT] or keys[_K_A]:
+            self.vel_x = -MOVE_SPEED
+        if keys[_K_RIGHT] or keys[_K_D]:
+            self.vel_x = MOVE_SPEED
 
     def queue_jump(self):
         """Record a jump press; will fire when allowed (buffered)."""
         self.jump_buffer_timer = JUMP_BUFFER_TIME
 
     def _do_jump(self):
-        self.vel.y = JUMP_VEL
+        self.vel_y = JUMP_VEL
         self.on_ground = False
         self.coyote_timer = 0.0
         self.jump_buffer_timer = 0.0
 
     def apply_gravity(self):
-        self.vel.y += GRAVITY
+        self.vel_y += GRAVITY
+
+    def _grid_for(self, solids):
+        if isinstance(solids, SolidGrid):
+            return solids
+        # Level solids are static, so the index keyed on the list object never goes stale
+        if solids is not self._solids_src:
+            self._solids_src = solids
+            self._solids_grid = SolidGrid(solids)
+        return self._solids_grid
 
     def move_and_collide(self, solids):
+        """
+        `solids` is a level.SolidGrid or a list of rects (indexed on first use);
+        only rects near the player are tested.
+        """
+        solids = self._grid_for(solids)
+        # bind the hot attributes once; rect is mutated in place
+        rect = self.rect
+        vel_x, vel_y = self.vel_x, self.vel_y
         # Horizontal
-        self.pos.x += self.vel.x
-        self.rect.x = int(self.pos.x)
-        hits = [r for r in solids if self.rect.colliderect(r)]
+        pos_x = self.pos_x + vel_x
+        rect.x = int(pos_x)
+        # One broad-phase query over the box swept by both moves serves both axes
+        sweep = rect.union(rect.move(0, int(self.pos_y + vel_y) - rect.y))
+        candidates = solids.query(sweep)
+        hits = [candidates[i] for i in rect.collidelistall(candidates)]
         for r in hits:
-            if self.vel.x > 0:
-                self.rect.right = r.left
-            elif self.vel.x < 0:
-                self.rect.left = r.right
-            self.pos.x = self.rect.x
+            if vel_x > 0:
+                rect.right = r.left
+            elif vel_x < 0:
+                rect.left = r.right
+            pos_x = rect.x
+        self.pos_x = pos_x
 
         # Vertical
-        self.pos.y += self.vel.y
-        self.rect.y = int(self.pos.y)
-        hits = [r for r in solids if self.rect.colliderect(r)]
+        pos_y = self.pos_y + vel_y
+        rect.y = int(pos_y)
+        if not sweep.contains(rect):
+            # x-resolution pushed us back past where we started (e.g. spawned inside a tile)
+            candidates = solids.query(rect)
+        hits = [candidates[i] for i in rect.collidelistall(candidates)]
         self.on_ground = False
         for r in hits:
-            if self.vel.y > 0:
-                self.rect.bottom = r.top
+            if vel_y > 0:
+                rect.bottom = r.top
                 self.on_ground = True
-                self.vel.y = 0
+                vel_y = 0.0
                 self.jumps = 0
-            elif self.vel.y < 0:
-                self.rect.top = r.bottom
-                self.vel.y = 0
-            self.pos.y = self.rect.y
+            elif vel_y < 0:
+                rect.top = r.bottom
+                vel_y = 0.0
+            pos_y = rect.y
+        self.pos_y, self.vel_y = pos_y, vel_y
 
         if self.on_ground:
             self.coyote_timer = COYOTE_TIME
@@ -117,12 +181,12 @@ class Player(pygame.sprite.Sprite):
         # visuals
         if self.visual:
             if not self.on_ground:
-                state = "jump" if self.vel.y < 0 else "fall"
-            elif abs(self.vel.x) > 0.1:
+                state = "jump" if self.vel_y < 0 else "fall"
+            elif abs(self.vel_x) > 0.1:
                 state = "run"
             else:
                 state = "idle"
             if not state == "fall":
                 self.visual.set(state)
             self.visual.rect.topleft = self.rect.topleft
-            self.visual.update(dt, flip=(self.vel.x < 0))
\ No newline at end of file
+            self.visual.update(dt, flip=(self.vel_x < 0))
\ No newline at end of file